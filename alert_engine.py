@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+🚨 Threshold Alert Engine 🚨
+============================
+
+Watches raw numeric metrics (system stats, Sense HAT readings) and fires
+LED patterns when something needs attention.
+
+Every sample is checked the moment it arrives. Each rule only keeps the
+little bit of state it needs (is it active? what was the last value?), so
+nothing is ever rescanned - a sample costs one dict lookup plus one check
+per rule on that metric.
+
+Rule types:
+- ThresholdRule: fires when a value crosses a limit, with hysteresis so it
+  doesn't flap on/off around the limit
+- RateRule: fires when a value changes too fast (units per second), also
+  with hysteresis
+
+Patterns run on a background LED thread, so the sampling loop never waits
+on an LED show. A new alert cuts short whatever pattern is playing (newest
+alert wins), flashes all LEDs straight away, then plays its own pattern.
+The time from sample to that first flash is recorded for each alert
+(`engine.latencies`) - it should stay well under 100 ms.
+
+Default rules (see default_rules()):
+   CPU usage   > 90%     → lightning_storm
+   CPU temp    > 75°C    → sos_signal
+   Room temp   > 35°C    → fire_flicker   (Sense HAT)
+   Humidity    +5%/s     → matrix_rain    (Sense HAT)
+"""
+
+import queue
+import threading
+import time
+
+from oled_screen import get_raw_system_stats
+
+SAMPLE_INTERVAL = 0.5  # Seconds between samples
+LATENCY_TARGET = 0.1   # Sample → LED reaction target (seconds)
+ALERT_FLASH = 0.2      # All-LEDs flash before the alert pattern (seconds)
+STOP_TIMEOUT = 2.0     # How long stop() waits for the LED thread (seconds)
+
+
+class ThresholdRule:
+    """Fires when a metric crosses a limit, clears once it is back past clear_at"""
+
+    def __init__(self, metric, limit, pattern, param=None, clear_at=None, above=True):
+        self.metric = metric
+        self.limit = limit
+        self.pattern = pattern
+        self.param = param
+        self.above = above
+        # Default hysteresis band: 5% of the limit
+        if clear_at is None:
+            band = abs(limit) * 0.05
+            clear_at = limit - band if above else limit + band
+        self.clear_at = clear_at
+        self.active = False
+
+    @property
+    def name(self):
+        op = ">" if self.above else "<"
+        return f"{self.metric} {op} {self.limit}"
+
+    def update(self, value, timestamp):
+        """Check one sample. Returns True only when the alert first trips."""
+        if self.above:
+            tripped, cleared = value > self.limit, value < self.clear_at
+        else:
+            tripped, cleared = value < self.limit, value > self.clear_at
+
+        if not self.active and tripped:
+            self.active = True
+            return True
+        if self.active and cleared:
+            self.active = False
+        return False
+
+
+class RateRule:
+    """Fires when a metric changes faster than `rate` units per second"""
+
+    def __init__(self, metric, rate, pattern, param=None, clear_rate=None):
+        self.metric = metric
+        self.rate = rate  # Positive = rising, negative = falling
+        self.pattern = pattern
+        self.param = param
+        self.clear_rate = rate / 2 if clear_rate is None else clear_rate
+        self.active = False
+        self._last_value = None
+        self._last_time = None
+
+    @property
+    def name(self):
+        return f"{self.metric} rate {self.rate:+}/s"
+
+    def update(self, value, timestamp):
+        """Check one sample against the previous one. Returns True when the alert first trips."""
+        last_value, last_time = self._last_value, self._last_time
+        self._last_value, self._last_time = value, timestamp
+
+        if last_time is None or timestamp <= last_time:
+            return False
+
+        change = (value - last_value) / (timestamp - last_time)
+        if self.rate >= 0:
+            tripped, cleared = change > self.rate, change < self.clear_rate
+        else:
+            tripped, cleared = change < self.rate, change > self.clear_rate
+
+        if not self.active and tripped:
+            self.active = True
+            return True
+        if self.active and cleared:
+            self.active = False
+        return False
+
+
+def default_rules():
+    """Fresh rule objects - rules keep state, so each engine needs its own"""
+    return [
+        ThresholdRule('cpu', 90, "lightning_storm", 4, clear_at=70),
+        ThresholdRule('cpu_temp', 75, "sos_signal", 1, clear_at=70),
+        ThresholdRule('temperature', 35, "fire_flicker", 5, clear_at=33),
+        RateRule('humidity', 5, "matrix_rain", 2),
+    ]
+
+
+class AlertEngine:
+    """Routes metric samples to their rules and plays LED patterns for alerts"""
+
+    def __init__(self, controller, rules=None):
+        self.controller = controller
+        self.rules = {}  # metric name → list of rules
+        self.latencies = []  # Sample → first LED write, in seconds
+        self._alerts = queue.Queue()
+        self._pending = set()  # Rules already waiting in the queue
+        self._lock = threading.Lock()
+        self._stopping = False
+
+        for rule in (default_rules() if rules is None else rules):
+            self.add_rule(rule)
+
+        self._worker = threading.Thread(target=self._led_worker, daemon=True)
+        self._worker.start()
+
+    def add_rule(self, rule):
+        """Register a rule for its metric"""
+        if not hasattr(self.controller, rule.pattern):
+            raise ValueError(f"Unknown LED pattern for {rule.name}: {rule.pattern}")
+        self.rules.setdefault(rule.metric, []).append(rule)
+
+    def feed(self, metric, value, timestamp=None):
+        """Evaluate one sample against the rules for that metric"""
+        if value is None:
+            return
+        if timestamp is None:
+            timestamp = time.monotonic()
+
+        for rule in self.rules.get(metric, ()):
+            if rule.update(value, timestamp):
+                self._trigger(rule, timestamp)
+
+    def feed_all(self, samples, timestamp=None):
+        """Evaluate a dict of metric → value samples taken at the same moment"""
+        if timestamp is None:
+            timestamp = time.monotonic()
+        for metric, value in samples.items():
+            self.feed(metric, value, timestamp)
+
+    def stop(self, timeout=STOP_TIMEOUT):
+        """Cut short the current pattern and wait for the LED thread to exit"""
+        with self._lock:
+            self._stopping = True
+            self._alerts.put(None)
+            self.controller.interrupt.set()
+        self._worker.join(timeout)
+
+    def _trigger(self, rule, timestamp):
+        with self._lock:
+            # Don't stack up repeats of an alert that is already waiting to play
+            if rule in self._pending or self._stopping:
+                return
+            self._pending.add(rule)
+            self._alerts.put((rule, timestamp))
+            # Cut short whatever is playing so this alert shows up right away
+            self.controller.interrupt.set()
+        print(f"🚨 Alert: {rule.name}")
+
+    def _led_worker(self):
+        while True:
+            item = self._alerts.get()
+
+            with self._lock:
+                if self._stopping:
+                    break
+                rule, timestamp = item
+                self._pending.discard(rule)
+                # A newer alert is already waiting - let it win
+                if not self._alerts.empty():
+                    continue
+                self.controller.interrupt.clear()
+
+            try:
+                self.controller.all_on()
+                latency = time.monotonic() - timestamp
+                self.latencies.append(latency)
+                if latency > LATENCY_TARGET:
+                    print(f"⚠️  {rule.pattern} lit {latency * 1000:.0f} ms after sample")
+
+                self.controller.pause(ALERT_FLASH)
+                self.controller.all_off()
+
+                pattern_method = getattr(self.controller, rule.pattern)
+                if rule.param is None:
+                    pattern_method()
+                else:
+                    pattern_method(rule.param)
+            except Exception as e:
+                # An interrupted pattern is expected, anything else is a real fault
+                if not self.controller.interrupt.is_set():
+                    print(f"❌ {rule.pattern} failed: {e!r}")
+
+            try:
+                self.controller.all_off()
+            except Exception as e:
+                print(f"❌ Couldn't turn LEDs off: {e!r}")
+
+def get_sense_hat_readings(sense):
+    """Raw Sense HAT environment readings"""
+    return {
+        'temperature': sense.get_temperature(),
+        'humidity': sense.get_humidity(),
+        'pressure': sense.get_pressure(),
+    }
+
+
+def main():
+    """Sample system stats (and Sense HAT if present) and react with LEDs"""
+    from led_cycle import LEDController
+
+    controller = LEDController()
+    engine = AlertEngine(controller)
+
+    try:
+        from sense_hat import SenseHat
+        sense = SenseHat()
+    except (ImportError, OSError) as e:
+        print(f"⚠️  No Sense HAT ({e}) - watching system stats only")
+        sense = None
+
+    try:
+        print("🚨 Watching metrics! Press Ctrl+C to stop\n")
+        get_raw_system_stats(cpu_interval=None)  # Prime the non-blocking CPU reading
+
+        while True:
+            timestamp = time.monotonic()
+
+            # Non-blocking CPU reading so sampling stays on SAMPLE_INTERVAL
+            stats = get_raw_system_stats(cpu_interval=None)
+            if stats is not None:
+                engine.feed_all(stats, timestamp)
+
+            if sense is not None:
+                try:
+                    readings = get_sense_hat_readings(sense)
+                except OSError as e:
+                    # One bad read shouldn't stop the CPU alerts - skip this sample
+                    print(f"⚠️  Sense HAT read failed: {e}")
+                else:
+                    engine.feed_all(readings, timestamp)
+
+            time.sleep(SAMPLE_INTERVAL)
+
+    except KeyboardInterrupt:
+        print("\n\n🚨 Alert engine stopped by user")
+    finally:
+        if engine.latencies:
+            worst = max(engine.latencies) * 1000
+            print(f"⏱️  {len(engine.latencies)} alerts, worst reaction {worst:.1f} ms")
+        # Let the LED thread finish with the pins before releasing them
+        engine.stop()
+        controller.cleanup()
+
+
+if __name__ == "__main__":
+    main()
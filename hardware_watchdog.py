@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+🐕 Hardware I/O Watchdog 🐕
+===========================
+
+Keeps one flaky device from taking down the whole project.
+
+Each piece of hardware (an OLED, the LED bank, ...) is wrapped in a
+SupervisedDevice. Every call to it is timed, and if a call raises or takes
+longer than its timeout the device is cut off (the "circuit breaker" opens):
+further calls are skipped instantly instead of crashing or hanging, and the
+watchdog tries to reconnect with exponential back-off (0.5s, 1s, 2s, ... up
+to 30s). A reconnected device is on probation ("half-open") - it only
+counts as recovered, and the back-off only resets, once a real call works.
+
+A hung call can't be killed: its thread is left running in the background.
+The device isn't closed or reconnected until that thread has finished, so
+there is never more than one stuck thread per device and a new connection
+never shares the bus with a call that is still in flight.
+
+Each device records:
+- fault latencies: how long a failing call ran before it was caught
+- recovery times:  fault → first successful call afterwards (mean = MTTR)
+
+Run this file to drive both OLEDs (0x3C and 0x3D) next to the LED show -
+unplug a display mid-show and the LEDs and the other display keep going.
+"""
+
+import threading
+import time
+from collections import deque
+
+CALL_TIMEOUT = 1.0   # Seconds before a hardware call counts as hung
+BASE_DELAY = 0.5     # First reconnect delay (seconds)
+MAX_DELAY = 30.0     # Longest reconnect delay (seconds)
+
+
+class HardwareTimeout(Exception):
+    """A hardware call took longer than its timeout"""
+
+
+class SupervisedDevice:
+    """Wraps one device with call timing, a circuit breaker and auto-reconnect"""
+
+    def __init__(self, name, connect, close=None, timeout=CALL_TIMEOUT,
+                 base_delay=BASE_DELAY, max_delay=MAX_DELAY, label=None):
+        self.name = name
+        self.label = label or name  # Short name for the OLED status screen
+        self.connect = connect      # Returns a fresh device object
+        self.close = close          # Optional cleanup for a broken device
+        self.timeout = timeout      # None = run inline, time only
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+        self.device = None
+        self.failures = 0           # Consecutive faults (drives back-off)
+        self.retry_at = 0.0
+        self._fault_time = None     # When the current outage started
+        self._worker = None         # Thread running the latest timed call
+        self._broken = None         # Faulted device still waiting to be closed
+
+        self.call_times = deque(maxlen=100)
+        self.fault_latencies = []
+        self.recovery_times = []
+
+        self._reconnect()
+
+    @property
+    def healthy(self):
+        return self.device is not None
+
+    @property
+    def mttr(self):
+        """Mean time to recovery in seconds, or None if nothing has recovered yet"""
+        if not self.recovery_times:
+            return None
+        return sum(self.recovery_times) / len(self.recovery_times)
+
+    def call(self, action, *args):
+        """Run action(device, *args). Returns None if the device is down or the call fails."""
+        if self.device is None:
+            if time.monotonic() < self.retry_at or self._hung():
+                return None
+            if not self._reconnect():
+                return None
+
+        start = time.monotonic()
+        try:
+            result = self._run(action, self.device, *args)
+        except Exception as e:
+            self._fault(e, start)
+            return None
+
+        self.call_times.append(time.monotonic() - start)
+        if self._fault_time is not None:
+            recovery = time.monotonic() - self._fault_time
+            self.recovery_times.append(recovery)
+            print(f"✅ {self.name} recovered after {recovery:.2f}s")
+            self._fault_time = None
+        self.failures = 0
+        return result
+
+    def report(self):
+        """One-line health summary"""
+        status = "OK" if self.healthy else "DOWN"
+        line = f"{self.name}: {status}, {len(self.fault_latencies)} faults"
+        if self.mttr is not None:
+            line += f", MTTR {self.mttr:.2f}s"
+        return line
+
+    def status(self):
+        """Compact summary that fits one OLED line, e.g. "0x3C OK f2 1.2s" """
+        line = f"{self.label} {'OK' if self.healthy else 'DOWN'} f{len(self.fault_latencies)}"
+        if self.mttr is not None:
+            line += f" {self.mttr:.1f}s"
+        return line
+
+    def shutdown(self):
+        """Close the device for good, whether it is working or faulted"""
+        for device in (self.device, self._broken):
+            if device is not None and self.close is not None:
+                try:
+                    self._run(self.close, device)
+                except Exception as e:
+                    print(f"⚠️  {self.name} didn't close cleanly: {e!r}")
+        self.device = self._broken = None
+
+    def _run(self, fn, *args):
+        if self.timeout is None:
+            return fn(*args)
+
+        # Run in a throwaway thread so a hung bus can't hang the caller
+        outcome = {}
+
+        def target():
+            try:
+                outcome['result'] = fn(*args)
+            except Exception as e:
+                outcome['error'] = e
+
+        worker = self._worker = threading.Thread(target=target, daemon=True)
+        worker.start()
+        worker.join(self.timeout)
+
+        if worker.is_alive():
+            raise HardwareTimeout(f"no response after {self.timeout}s")
+        if 'error' in outcome:
+            raise outcome['error']
+        return outcome.get('result')
+
+    def _hung(self):
+        """True while a timed-out call is still stuck in its thread"""
+        return self._worker is not None and self._worker.is_alive()
+
+    def _reconnect(self):
+        # Close the old device now that nothing is using it any more
+        broken, self._broken = self._broken, None
+        if broken is not None and self.close is not None:
+            try:
+                self._run(self.close, broken)
+            except Exception:
+                pass  # Already broken - nothing more to do
+            if self._hung():
+                return False  # Close is stuck - try again once it finishes
+
+        start = time.monotonic()
+        try:
+            self.device = self._run(self.connect)
+        except Exception as e:
+            self._fault(e, start)
+            return False
+        return True
+
+    def _fault(self, error, start):
+        now = time.monotonic()
+        self.fault_latencies.append(now - start)
+        if self._fault_time is None:
+            self._fault_time = now
+
+        # Closing waits for the next reconnect, when any hung call is done with it
+        if self.device is not None:
+            self._broken = self.device
+        self.device = None
+
+        delay = min(self.base_delay * 2 ** self.failures, self.max_delay)
+        self.failures += 1
+        self.retry_at = now + delay
+        print(f"❌ {self.name} fault: {error!r} - retrying in {delay:.1f}s")
+
+
+def connect_oled(address):
+    """Returns a connect function for a 128x64 OLED at the given I2C address"""
+    def connect():
+        from luma.core.interface.serial import i2c
+        from luma.oled.device import ssd1306
+
+        serial = i2c(port=1, address=address)
+        return ssd1306(serial, width=128, height=64)
+    return connect
+
+
+def draw_report(device, devices):
+    """Health of each supervised device, laid out like oled_screen.draw_stats"""
+    from luma.core.render import canvas
+
+    with canvas(device) as draw:
+        # Header
+        draw.text((0, 0), "Watchdog", fill=255)
+
+        for i, supervised in enumerate(devices[:3]):
+            draw.text((0, 16 + i * 12), supervised.status(), fill=255)
+
+
+def main():
+    """LED show plus both OLEDs, each supervised independently"""
+    from led_cycle import LEDController
+    from oled_screen import draw_stats, get_system_stats
+
+    weather = SupervisedDevice("Weather OLED 0x3C", connect_oled(0x3C), label="0x3C")
+    sensor = SupervisedDevice("Sensor OLED 0x3D", connect_oled(0x3D), label="0x3D")
+    # Patterns run for seconds, so the LEDs are timed but not timed out
+    leds = SupervisedDevice("LEDs", LEDController, close=LEDController.cleanup, timeout=None)
+    devices = [weather, sensor, leds]
+    stop = threading.Event()
+
+    def update_displays():
+        while not stop.is_set():
+            weather.call(draw_stats, get_system_stats())
+            sensor.call(draw_report, devices)
+            stop.wait(2)
+
+    threading.Thread(target=update_displays, daemon=True).start()
+
+    patterns = [("knight_rider", 2), ("chase_patterns", 2), ("heartbeat", 4), ("sparkle_burst", 6)]
+
+    try:
+        print("🐕 Watchdog running! Press Ctrl+C to stop\n")
+
+        while True:
+            for pattern_name, param in patterns:
+                leds.call(lambda c: getattr(c, pattern_name)(param))
+                time.sleep(1.0)
+
+    except KeyboardInterrupt:
+        print("\n\n🐕 Watchdog stopped by user")
+    finally:
+        stop.set()
+        for device in devices:
+            print(f"📊 {device.report()}")
+            device.shutdown()
+
+
+if __name__ == "__main__":
+    main()
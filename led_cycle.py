@@ -40,16 +40,21 @@ Hardware: 6 LEDs with 330Ω resistors (see wiring layout above)
 import time
 import random
 import math
+import threading
 from gpiozero import LED, PWMLED
 
 # GPIO Configuration (matches physical pin layout top to bottom)
 LED_PINS = [4, 17, 27, 22, 18, 23]  # Physical pins 7, 11, 13, 15, 12, 16
 LED_COLORS = ["🔴 Red", "🟢 Green", "🔵 Blue", "🟡 Yellow", "🟠 Orange", "🟣 Purple"]
 
+class PatternInterrupted(Exception):
+    """Raised inside a pattern when LEDController.interrupt is set"""
+
 class LEDController:
     def __init__(self):
         self.leds = [LED(pin) for pin in LED_PINS]
         self.running = True
+        self.interrupt = threading.Event()  # Set from another thread to cut a pattern short
         print("🎭 LED Light Show Starting...")
         self._test_leds()
     
@@ -73,6 +78,11 @@ class LEDController:
         for led in self.leds:
             led.on()
     
+    def pause(self, seconds):
+        """Sleep inside a pattern, bailing out early if interrupted"""
+        if self.interrupt.wait(seconds):
+            raise PatternInterrupted()
+
     def cleanup(self):
         """Clean shutdown"""
         self.running = False
@@ -103,7 +113,7 @@ class LEDController:
                     pwm_leds[i].value = 1.0  # Main LED
                     if i > 0:
                         pwm_leds[i-1].value = 0.3  # Trail
-                    time.sleep(0.15)
+                    self.pause(0.15)
                 
                 # Sweep left  
                 for i in range(len(pwm_leds)-1, -1, -1):
@@ -112,7 +122,7 @@ class LEDController:
                     pwm_leds[i].value = 1.0  # Main LED
                     if i < len(pwm_leds)-1:
                         pwm_leds[i+1].value = 0.3  # Trail
-                    time.sleep(0.15)
+                    self.pause(0.15)
         finally:
             for led in pwm_leds:
                 led.close()
@@ -134,18 +144,18 @@ class LEDController:
                 for brightness in range(0, 101, 3):
                     for led in pwm_leds:
                         led.value = brightness / 100.0
-                    time.sleep(0.03)
+                    self.pause(0.03)
                 
                 # Hold
-                time.sleep(0.2)
+                self.pause(0.2)
                 
                 # Breathe out
                 for brightness in range(100, -1, -3):
                     for led in pwm_leds:
                         led.value = brightness / 100.0
-                    time.sleep(0.03)
+                    self.pause(0.03)
                 
-                time.sleep(0.3)
+                self.pause(0.3)
         finally:
             for led in pwm_leds:
                 led.close()
@@ -158,7 +168,7 @@ class LEDController:
         start_time = time.time()
         while time.time() - start_time < duration:
             # Random pause between strikes
-            time.sleep(random.uniform(0.1, 1.5))
+            self.pause(random.uniform(0.1, 1.5))
             
             # Lightning strike!
             strike_leds = random.sample(self.leds, random.randint(1, 3))
@@ -166,17 +176,17 @@ class LEDController:
             # Quick flash
             for led in strike_leds:
                 led.on()
-            time.sleep(random.uniform(0.05, 0.15))
+            self.pause(random.uniform(0.05, 0.15))
             
             for led in strike_leds:
                 led.off()
-            time.sleep(random.uniform(0.02, 0.08))
+            self.pause(random.uniform(0.02, 0.08))
             
             # Sometimes double strike
             if random.random() < 0.3:
                 for led in strike_leds:
                     led.on()
-                time.sleep(random.uniform(0.03, 0.1))
+                self.pause(random.uniform(0.03, 0.1))
                 for led in strike_leds:
                     led.off()
     
@@ -200,7 +210,7 @@ class LEDController:
                     brightness = max(0, min(1, base_brightness + flicker))
                     led.value = brightness
                 
-                time.sleep(random.uniform(0.05, 0.15))
+                self.pause(random.uniform(0.05, 0.15))
         finally:
             for led in pwm_leds:
                 led.close()
@@ -220,11 +230,11 @@ class LEDController:
                     if (wave + i) % 3 == 0 or (wave - i) % 4 == 0:
                         self.leds[i].on()
                 
-                time.sleep(0.2)
+                self.pause(0.2)
             
             # Brief pause between cycles
             self.all_off()
-            time.sleep(0.5)
+            self.pause(0.5)
     
     def sparkle_burst(self, bursts=8):
         """✨ Random sparkle explosions"""
@@ -238,11 +248,11 @@ class LEDController:
             # Quick burst
             for led in selected_leds:
                 led.on()
-            time.sleep(random.uniform(0.1, 0.3))
+            self.pause(random.uniform(0.1, 0.3))
             
             for led in selected_leds:
                 led.off()
-            time.sleep(random.uniform(0.2, 0.6))
+            self.pause(random.uniform(0.2, 0.6))
     
     def binary_counter(self, max_count=64):
         """🔢 Binary counting display (0-63 with 6 LEDs)"""
@@ -256,10 +266,10 @@ class LEDController:
                 if bit == '1':
                     self.leds[i].on()
             
-            time.sleep(0.5)
+            self.pause(0.5)
         
         self.all_off()
-        time.sleep(0.5)
+        self.pause(0.5)
     
     def sos_signal(self, repeats=2):
         """🆘 SOS morse code"""
@@ -267,31 +277,31 @@ class LEDController:
         
         def dot():
             self.all_on()
-            time.sleep(0.2)
+            self.pause(0.2)
             self.all_off()
-            time.sleep(0.2)
+            self.pause(0.2)
         
         def dash():
             self.all_on() 
-            time.sleep(0.6)
+            self.pause(0.6)
             self.all_off()
-            time.sleep(0.2)
+            self.pause(0.2)
         
         for _ in range(repeats):
             # S (dot dot dot)
             for _ in range(3):
                 dot()
-            time.sleep(0.4)
+            self.pause(0.4)
             
             # O (dash dash dash)  
             for _ in range(3):
                 dash()
-            time.sleep(0.4)
+            self.pause(0.4)
             
             # S (dot dot dot)
             for _ in range(3):
                 dot()
-            time.sleep(1.2)
+            self.pause(1.2)
     
     def sine_wave_pulse(self, cycles=3):
         """🌊 Mathematical sine wave pattern"""
@@ -312,7 +322,7 @@ class LEDController:
                     for led in pwm_leds:
                         led.value = brightness
                     
-                    time.sleep(0.05)
+                    self.pause(0.05)
         finally:
             for led in pwm_leds:
                 led.close()
@@ -339,7 +349,7 @@ class LEDController:
                         brightness = (math.sin(phase) + 1) / 2
                         led.value = brightness
                     
-                    time.sleep(0.05)
+                    self.pause(0.05)
         finally:
             for led in pwm_leds:
                 led.close()
@@ -355,7 +365,7 @@ class LEDController:
                 self.all_off()
                 self.leds[i % len(self.leds)].on()
                 self.leds[(i + 3) % len(self.leds)].on()
-                time.sleep(0.15)
+                self.pause(0.15)
             
             # Triple chase
             for i in range(len(self.leds) * 2):
@@ -363,7 +373,7 @@ class LEDController:
                 self.leds[i % len(self.leds)].on()
                 self.leds[(i + 2) % len(self.leds)].on()
                 self.leds[(i + 4) % len(self.leds)].on()
-                time.sleep(0.12)
+                self.pause(0.12)
     
     def pendulum_swing(self, swings=8):
         """⚖️ Realistic pendulum motion with physics"""
@@ -399,7 +409,7 @@ class LEDController:
                         if main_led < len(pwm_leds) - 1:
                             pwm_leds[main_led + 1].value = 0.3
                     
-                    time.sleep(0.08)
+                    self.pause(0.08)
         finally:
             for led in pwm_leds:
                 led.close()
@@ -421,17 +431,17 @@ class LEDController:
                 for brightness in [0, 0.3, 0.8, 1.0, 0.6, 0.2, 0]:
                     for led in pwm_leds:
                         led.value = brightness
-                    time.sleep(0.08)
+                    self.pause(0.08)
                 
-                time.sleep(0.15)  # Brief pause
+                self.pause(0.15)  # Brief pause
                 
                 # Second beat (dub)
                 for brightness in [0, 0.4, 0.9, 0.5, 0.1, 0]:
                     for led in pwm_leds:
                         led.value = brightness
-                    time.sleep(0.06)
+                    self.pause(0.06)
                 
-                time.sleep(0.4)  # Pause between heartbeats
+                self.pause(0.4)  # Pause between heartbeats
         finally:
             for led in pwm_leds:
                 led.close()
@@ -451,7 +461,7 @@ class LEDController:
                 if random.random() < 0.3 + (i * 0.1):  # Higher frequencies more active
                     led.on()
             
-            time.sleep(random.uniform(0.05, 0.15))
+            self.pause(random.uniform(0.05, 0.15))
     
     def traffic_light(self, cycles=3):
         """🚦 Traffic light sequence"""
@@ -462,21 +472,21 @@ class LEDController:
             # Red
             self.all_off()
             self.leds[0].on()  # Red
-            time.sleep(2.0)
+            self.pause(2.0)
             
             # Red + Yellow
             self.leds[1].on()  # Yellow
-            time.sleep(1.0)
+            self.pause(1.0)
             
             # Green
             self.all_off()
             self.leds[2].on()  # Green
-            time.sleep(2.0)
+            self.pause(2.0)
             
             # Yellow
             self.all_off()
             self.leds[1].on()  # Yellow
-            time.sleep(1.0)
+            self.pause(1.0)
         
         self.all_off()
 
@@ -2,37 +2,55 @@
 """Simple system stats display on 128x64 OLED via I2C pins 3/5"""
 
 import time
-from luma.core.interface.serial import i2c
-from luma.core.render import canvas
-from luma.oled.device import ssd1306
 
-# Setup OLED
-serial = i2c(port=1, address=0x3C)
-device = ssd1306(serial, width=128, height=64)
-
-# Get system info
-def get_system_stats():
+# Get raw system info (numbers, so alert rules can react to them)
+# cpu_interval=None doesn't block, but reports usage since the previous call
+def get_raw_system_stats(cpu_interval=1):
     try:
         import psutil
-        cpu = psutil.cpu_percent(interval=1)
+        cpu = psutil.cpu_percent(interval=cpu_interval)
         mem = psutil.virtual_memory()
         disk = psutil.disk_usage('/')
 
         return {
-            'cpu': f"{cpu:.0f}%",
-            'mem': f"{mem.used/1e9:.1f}G/{mem.total/1e9:.1f}G",
-            'disk': f"{disk.used/1e9:.1f}G/{disk.total/1e9:.1f}G"
+            'cpu': cpu,
+            'mem_used': mem.used / 1e9,
+            'mem_total': mem.total / 1e9,
+            'mem_percent': mem.percent,
+            'disk_used': disk.used / 1e9,
+            'disk_total': disk.total / 1e9,
+            'disk_percent': disk.percent,
+            'cpu_temp': get_cpu_temperature(),
         }
     except ImportError:
+        return None
+
+def get_cpu_temperature():
+    """CPU temperature in °C, or None if it can't be read"""
+    try:
+        with open('/sys/class/thermal/thermal_zone0/temp') as f:
+            return int(f.read().strip()) / 1000.0
+    except (OSError, ValueError):
+        return None
+
+# Get system info
+def get_system_stats():
+    stats = get_raw_system_stats()
+    if stats is None:
         return {
             'cpu': "??%",
             'mem': "??G/??G",
             'disk': "??G/??G"
         }
 
-# Main display loop
-while True:
-    stats = get_system_stats()
+    return {
+        'cpu': f"{stats['cpu']:.0f}%",
+        'mem': f"{stats['mem_used']:.1f}G/{stats['mem_total']:.1f}G",
+        'disk': f"{stats['disk_used']:.1f}G/{stats['disk_total']:.1f}G"
+    }
+
+def draw_stats(device, stats):
+    from luma.core.render import canvas
 
     with canvas(device) as draw:
         # Header
@@ -47,4 +65,19 @@ while True:
         # Disk
         draw.text((0, 40), f"DISK: {stats['disk']}", fill=255)
 
-    time.sleep(2)  # Update every 2 seconds
+def main():
+    from hardware_watchdog import SupervisedDevice, connect_oled
+
+    # Setup OLED (reconnects on its own if it drops off the I2C bus)
+    display = SupervisedDevice("OLED 0x3C", connect_oled(0x3C))
+
+    # Main display loop
+    try:
+        while True:
+            display.call(draw_stats, get_system_stats())
+            time.sleep(2)  # Update every 2 seconds
+    except KeyboardInterrupt:
+        print(f"\n📊 {display.report()}")
+
+if __name__ == "__main__":
+    main()